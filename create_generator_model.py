@@ -10,26 +10,39 @@
 # Usage:
 # - Open Blender, Text > New, paste this file and Run Script
 # OR (headless): blender --background --python create_generator_model.py
+# - Set RENDER_ENGINE=BLENDER_EEVEE_NEXT to preview with EEVEE instead of Cycles
+#   (BLENDER_EEVEE on Blender older than 4.2)
 
 import bpy
+import bmesh
 import math
+import os
+import numpy as np
 from mathutils import Vector, Euler
 
+# Collection every new object is linked into, resolved once instead of per object
+target_coll = bpy.context.collection
+
 # ---------- Helpers ----------
 
 def clean_scene():
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
-    # remove orphan data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
-    for block in bpy.data.materials:
-        if block.users == 0:
-            bpy.data.materials.remove(block)
+    # remove objects through bpy.data directly (no operators, no selection changes)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    # remove orphan data (single ID-graph walk in C, recursive so freed meshes release their materials);
+    # this covers every local ID type, but linked library data is left alone
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
+
+
+# Materials already set up by this run, keyed by name + parameters
+_MATERIAL_CACHE = {}
 
 
 def create_material(name, base_color=(1,1,1,1), metallic=0.0, roughness=0.5):
+    key = (name, tuple(base_color), metallic, roughness)
+    mat = _MATERIAL_CACHE.get(key)
+    if mat is not None:
+        return mat
     mat = bpy.data.materials.get(name)
     if mat is None:
         mat = bpy.data.materials.new(name)
@@ -39,73 +52,240 @@ def create_material(name, base_color=(1,1,1,1), metallic=0.0, roughness=0.5):
     principled.inputs["Base Color"].default_value = base_color
     principled.inputs["Metallic"].default_value = metallic
     principled.inputs["Roughness"].default_value = roughness
+    _MATERIAL_CACHE[key] = mat
     return mat
 
 
-def add_mesh_cube(name, size=0.1, location=(0,0,0), rotation=(0,0,0), material=None):
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location, rotation=rotation)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (size/2, size/2, size/2)  # because size=1 cube default
-    bpy.ops.object.transform_apply(scale=True)
-    if material:
-        if obj.data.materials:
-            obj.data.materials[0] = material
-        else:
-            obj.data.materials.append(material)
+# Unit cube (half-extent 1, same layout as Blender's default cube)
+CUBE_VERTS = [(1,1,1), (1,1,-1), (1,-1,1), (1,-1,-1), (-1,1,1), (-1,1,-1), (-1,-1,1), (-1,-1,-1)]
+CUBE_FACES = [(0,4,6,2), (3,2,6,7), (7,6,4,5), (5,1,3,7), (1,0,2,3), (5,4,0,1)]
+
+
+def _as_f32(seq):
+    # foreach_set only memcpy's when the buffer matches Blender's C float storage;
+    # float64 arrays or Python lists fall back to per-element conversion
+    return np.ascontiguousarray(seq, dtype=np.float32).ravel()
+
+
+def _as_intc(seq):
+    # same for index buffers: C int, not int64
+    return np.ascontiguousarray(seq, dtype=np.intc).ravel()
+
+
+def build_mesh(name, verts, faces):
+    # fill mesh buffers with foreach_set instead of going through bpy.ops
+    mesh = bpy.data.meshes.new(name)
+    co = _as_f32(verts)
+    face_sizes = _as_intc([len(f) for f in faces])
+    loop_starts = np.zeros(len(face_sizes), dtype=np.intc)
+    np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set("co", co)
+    mesh.loops.add(int(face_sizes.sum()))
+    mesh.loops.foreach_set("vertex_index", _as_intc(np.concatenate(faces)))
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", face_sizes)
+    # flat shading like the primitive operators; 4.x treats faces without sharp_face as smooth
+    mesh.polygons.foreach_set("use_smooth", np.zeros(len(face_sizes), dtype=bool))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def cylinder_geometry(radius, depth, segments=32):
+    angles = np.linspace(0, 2*np.pi, segments, endpoint=False)
+    ring = np.column_stack((np.cos(angles) * radius, np.sin(angles) * radius))
+    bottom = np.column_stack((ring, np.full(segments, -depth/2)))
+    top = np.column_stack((ring, np.full(segments, depth/2)))
+    verts = np.vstack((bottom, top))
+    idx = np.arange(segments)
+    nxt = (idx + 1) % segments
+    sides = np.column_stack((idx, nxt, nxt + segments, idx + segments))
+    faces = list(sides) + [idx[::-1], idx + segments]
+    return verts, faces
+
+
+def torus_geometry(major_radius, minor_radius, major_segments=48, minor_segments=12):
+    theta = np.linspace(0, 2*np.pi, major_segments, endpoint=False)[:, None]
+    phi = np.linspace(0, 2*np.pi, minor_segments, endpoint=False)[None, :]
+    ring = major_radius + minor_radius * np.cos(phi)
+    x = ring * np.cos(theta)
+    y = ring * np.sin(theta)
+    z = np.broadcast_to(minor_radius * np.sin(phi), x.shape)
+    verts = np.stack((x, y, z), axis=-1).reshape(-1, 3)
+    i = np.arange(major_segments)[:, None]
+    j = np.arange(minor_segments)[None, :]
+    i1 = (i + 1) % major_segments
+    j1 = (j + 1) % minor_segments
+    faces = np.stack((i*minor_segments + j, i1*minor_segments + j, i1*minor_segments + j1, i*minor_segments + j1), axis=-1).reshape(-1, 4)
+    return verts, list(faces)
+
+
+# One mesh datablock per unique primitive; objects only carry their transform
+_MESH_CACHE = {}
+
+
+def get_shared_mesh(key, build):
+    mesh = _MESH_CACHE.get(key)
+    if mesh is None:
+        mesh = build_mesh("_".join(str(k) for k in key), *build())
+        mesh.materials.append(None)  # single slot, filled per object
+        _MESH_CACHE[key] = mesh
+    return mesh
+
+
+def assign_material(obj, material):
+    # mesh data is shared between objects, so bind the material on the object
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = material
+
+
+# (obj, material) pairs queued by the helpers and bound in one pass after all geometry exists
+_PENDING_MATERIALS = []
+
+
+def assign_pending_materials():
+    for obj, material in _PENDING_MATERIALS:
+        assign_material(obj, material)
+    _PENDING_MATERIALS.clear()
+
+
+def new_object(name, data):
+    # create and link explicitly; never rely on operators setting the active object
+    obj = bpy.data.objects.new(name, data)
+    target_coll.objects.link(obj)
     return obj
 
 
-def add_cylinder(name, radius=0.05, depth=0.01, location=(0,0,0), rotation=(0,0,0), material=None):
-    bpy.ops.mesh.primitive_cylinder_add(radius=radius, depth=depth, location=location, rotation=rotation)
-    obj = bpy.context.active_object
-    obj.name = name
+def add_mesh_object(name, mesh, location=(0,0,0), rotation=(0,0,0), material=None):
+    obj = new_object(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
     if material:
-        obj.data.materials.append(material)
+        _PENDING_MATERIALS.append((obj, material))
     return obj
 
 
+def cube_geometry(size_x, size_y, size_z):
+    # scale baked into the vertices, so objects keep a unit scale and need no transform_apply
+    verts = _as_f32(CUBE_VERTS).reshape(-1, 3) * np.array([size_x/2, size_y/2, size_z/2], dtype=np.float32)
+    return verts, CUBE_FACES
+
+
+def add_mesh_cube(name, size=0.1, location=(0,0,0), rotation=(0,0,0), material=None):
+    # size is either the edge length or an (x, y, z) tuple of box dimensions
+    dims = tuple(size) if isinstance(size, (tuple, list)) else (size, size, size)
+    key = ("cube",) + tuple(round(d, 6) for d in dims)
+    mesh = get_shared_mesh(key, lambda: cube_geometry(*dims))
+    return add_mesh_object(name, mesh, location, rotation, material=material)
+
+
+def add_cylinder(name, radius=0.05, depth=0.01, location=(0,0,0), rotation=(0,0,0), material=None):
+    key = ("cylinder", round(radius, 6), round(depth, 6))
+    mesh = get_shared_mesh(key, lambda: cylinder_geometry(radius, depth))
+    return add_mesh_object(name, mesh, location, rotation, material=material)
+
+
 def add_torus(name, major_radius=0.05, minor_radius=0.01, location=(0,0,0), rotation=(0,0,0), material=None):
-    bpy.ops.mesh.primitive_torus_add(major_radius=major_radius, minor_radius=minor_radius, location=location, rotation=rotation)
-    obj = bpy.context.active_object
-    obj.name = name
-    if material:
-        obj.data.materials.append(material)
-    return obj
+    key = ("torus", round(major_radius, 6), round(minor_radius, 6))
+    mesh = get_shared_mesh(key, lambda: torus_geometry(major_radius, minor_radius))
+    return add_mesh_object(name, mesh, location, rotation, material=material)
 
 
 def add_plane(name, size_x=1.0, size_y=1.0, thickness=0.02, location=(0,0,0), material=None):
     # create a thin box as wooden base
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (size_x/2, size_y/2, thickness/2)
-    bpy.ops.object.transform_apply(scale=True)
-    if material:
-        obj.data.materials.append(material)
-    return obj
+    return add_mesh_cube(name, size=(size_x, size_y, thickness), location=location, material=material)
 
 
-def add_bezier_cable(name, points, bevel_depth=0.003, material=None):
+def add_bezier_cable(name, cables, material=None):
+    # all cables of one color go into a single curve: one spline per (points, bevel_depth)
+    bevel_depth = max(depth for _, depth in cables)
     curve_data = bpy.data.curves.new(name + "_curve", type='CURVE')
     curve_data.dimensions = '3D'
-    poly = curve_data.splines.new('BEZIER')
-    poly.bezier_points.add(len(points)-1)
-    for i, p in enumerate(points):
-        bp = poly.bezier_points[i]
-        bp.co = Vector(p)
-        bp.handle_left_type = bp.handle_right_type = 'AUTO'
-    curve_obj = bpy.data.objects.new(name, curve_data)
-    bpy.context.collection.objects.link(curve_obj)
+    for points, depth in cables:
+        poly = curve_data.splines.new('BEZIER')
+        poly.bezier_points.add(len(points)-1)
+        for i, p in enumerate(points):
+            bp = poly.bezier_points[i]
+            bp.co = Vector(p)
+            bp.handle_left_type = bp.handle_right_type = 'AUTO'
+            bp.radius = depth / bevel_depth  # per-spline thickness, bevel is shared
+    curve_obj = new_object(name, curve_data)
     curve_data.bevel_depth = bevel_depth
-    curve_data.bevel_resolution = 6
-    if material:
-        # convert to mesh later or assign material to curve (works in export)
-        if curve_obj.data.materials:
-            curve_obj.data.materials[0] = material
-        else:
-            curve_obj.data.materials.append(material)
-    return curve_obj
+    curve_data.bevel_resolution = 2  # 8 sides per ring; enough at viewing distance
+    return curve_to_mesh(curve_obj, material)
+
+
+def curve_to_mesh(curve_obj, material=None):
+    # bake the evaluated curve once so it is not re-tessellated on every depsgraph update
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(curve_obj.evaluated_get(depsgraph))
+    name = curve_obj.name
+    curve_data = curve_obj.data
+    bpy.data.objects.remove(curve_obj, do_unlink=True)
+    bpy.data.curves.remove(curve_data)
+    mesh.name = name
+    mesh.materials.append(None)  # slot for the deferred material
+    return add_mesh_object(name, mesh, material=material)
+
+
+def join_meshes(name, objects):
+    # merge objects into one mesh with bmesh (linear, no join operator);
+    # each source material becomes a slot on the merged mesh
+    bm = bmesh.new()
+    materials = []
+    for obj in objects:
+        slot_map = []
+        for slot in obj.material_slots:
+            if slot.material not in materials:
+                materials.append(slot.material)
+            slot_map.append(materials.index(slot.material))
+        first_vert = len(bm.verts)
+        first_face = len(bm.faces)
+        bm.from_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+        # parts are unparented, so matrix_basis is their world transform (no depsgraph update needed)
+        bmesh.ops.transform(bm, matrix=obj.matrix_basis, verts=bm.verts[first_vert:])
+        for face in bm.faces[first_face:]:
+            face.material_index = slot_map[face.material_index] if slot_map else 0
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    for mat in materials:
+        mesh.materials.append(mat)
+    old_meshes = {obj.data for obj in objects}
+    for obj in objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for old in old_meshes:
+        if old.users == 0:
+            # forget removed meshes so get_shared_mesh never hands one back
+            for key in [k for k, m in _MESH_CACHE.items() if m == old]:
+                del _MESH_CACHE[key]
+            bpy.data.meshes.remove(old)
+    return add_mesh_object(name, mesh)
+
+
+def enable_gpu_devices(backends=('OPTIX', 'CUDA')):
+    # pick the first backend with a usable GPU and enable its devices;
+    # these are user preferences, so leave other devices alone and restore on fallback
+    prefs = bpy.context.preferences.addons['cycles'].preferences
+    original_backend = prefs.compute_device_type
+    for backend in backends:
+        try:
+            prefs.compute_device_type = backend
+        except TypeError:
+            continue  # backend not compiled into this Blender build
+        prefs.get_devices()
+        gpus = [d for d in prefs.devices if d.type == backend]
+        if gpus:
+            for d in gpus:
+                d.use = True
+            return backend
+    prefs.compute_device_type = original_backend
+    return None
 
 # ---------- Scene Setup ----------
 clean_scene()
@@ -144,14 +324,14 @@ disk = add_cylinder("RotatingDisk", radius=disk_radius, depth=disk_thickness, lo
 num_magnets = 8
 mag_size = 0.02
 mag_z = disk.location.z + disk_thickness/2 + mag_size/2 - 0.01
+radius_pos = disk_radius - mag_size/2 - 0.005
+mag_angles = np.linspace(0, 2*np.pi, num_magnets, endpoint=False)
+mag_xs = np.cos(mag_angles) * radius_pos
+mag_ys = np.sin(mag_angles) * radius_pos
 for i in range(num_magnets):
-    angle = (2*math.pi/num_magnets) * i
-    radius_pos = disk_radius - mag_size/2 - 0.005
-    x = math.cos(angle) * radius_pos
-    y = math.sin(angle) * radius_pos
+    angle = float(mag_angles[i])
     mat = mat_magnet_red if i % 2 == 0 else mat_magnet_blue
-    mag = add_mesh_cube(f"Magnet_{i+1}", size=mag_size, location=(x,y,mag_z), rotation=(0,0,angle))
-    mag.data.materials.append(mat)
+    mag = add_mesh_cube(f"Magnet_{i+1}", size=mag_size, location=(mag_xs[i],mag_ys[i],mag_z), rotation=(0,0,angle), material=mat)
     # Slightly offset orientation so face pole visible
     mag.rotation_euler = Euler((0,0,angle), 'XYZ')
 
@@ -159,69 +339,67 @@ for i in range(num_magnets):
 coil_major = 0.055
 coil_minor = 0.012
 coil_z = disk.location.z
-for j in range(4):
-    ang = j * (math.pi/2)
-    x = math.cos(ang) * coil_major
-    y = math.sin(ang) * coil_major
-    rot = (math.pi/2, 0, ang)
+# angle/position table shared by coils, wires and coil cables
+coil_angles = np.arange(4) * (np.pi/2)
+coil_xs = np.cos(coil_angles) * coil_major
+coil_ys = np.sin(coil_angles) * coil_major
+for j, (x, y, ang) in enumerate(zip(coil_xs, coil_ys, coil_angles)):
+    rot = (math.pi/2, 0, float(ang))
     coil = add_torus(f"Coil_{j+1}", major_radius=coil_major, minor_radius=coil_minor, location=(x,y,coil_z), rotation=rot, material=mat_coil_yellow)
     # make coil appear fixed: don't parent to disk
-
-# Add simple copper wire wraps (thin torus or curve) - approximate with smaller torus
-for j in range(4):
-    ang = j * (math.pi/2)
-    x = math.cos(ang) * coil_major
-    y = math.sin(ang) * coil_major
-    wire = add_torus(f"Wire_{j+1}", major_radius=coil_major, minor_radius=coil_minor*0.35, location=(x,y,coil_z), rotation=(math.pi/2,0,ang), material=mat_copper)
+    # simple copper wire wrap (thin torus) on the same coil
+    wire = add_torus(f"Wire_{j+1}", major_radius=coil_major, minor_radius=coil_minor*0.35, location=(x,y,coil_z), rotation=rot, material=mat_copper)
 
 # Green PCB with bridge rectifier and heat sink
 pcb_x = 0.09
 pcb_y = -0.05
-pcb = add_mesh_cube("PCB", size=0.06, location=(pcb_x, pcb_y, 0.01), material=mat_pcb)
-pcb.scale = (0.06/2, 0.04/2, 0.003/2)
-bpy.ops.object.transform_apply(scale=True)
+pcb = add_mesh_cube("PCB", size=(0.06, 0.04, 0.003), location=(pcb_x, pcb_y, 0.01), material=mat_pcb)
 # Bridge rectifier (small box)
 rect = add_mesh_cube("BridgeRectifier", size=0.012, location=(pcb_x+0.012, pcb_y, pcb.location.z+0.008), material=mat_plastic)
 # Heat sink (aluminum fins)
-hs_base = add_mesh_cube("HeatSinkBase", size=0.016, location=(pcb_x-0.012, pcb_y, pcb.location.z+0.008), material=mat_heat_sink)
-hs_base.scale = (0.016/2, 0.012/2, 0.002/2); bpy.ops.object.transform_apply(scale=True)
+hs_base = add_mesh_cube("HeatSinkBase", size=(0.016, 0.012, 0.002), location=(pcb_x-0.012, pcb_y, pcb.location.z+0.008), material=mat_heat_sink)
 # create some fins
 for f in range(4):
     fx = hs_base.location.x
     fy = hs_base.location.y - 0.004 + f*0.002
-    fin = add_mesh_cube(f"Fin_{f+1}", size=0.003, location=(fx, fy, hs_base.location.z+0.003), material=mat_heat_sink)
-    fin.scale = (0.003/2, 0.001/2, 0.006/2); bpy.ops.object.transform_apply(scale=True)
+    fin = add_mesh_cube(f"Fin_{f+1}", size=(0.003, 0.001, 0.006), location=(fx, fy, hs_base.location.z+0.003), material=mat_heat_sink)
 
 # Battery (blue, 12V)
-battery = add_mesh_cube("Battery12V", size=0.05, location=(-0.09, -0.07, 0.02), material=mat_battery)
-battery.scale = (0.05/2, 0.02/2, 0.03/2); bpy.ops.object.transform_apply(scale=True)
+battery = add_mesh_cube("Battery12V", size=(0.05, 0.02, 0.03), location=(-0.09, -0.07, 0.02), material=mat_battery)
 
 # Inverter (gray, 500W)
-inverter = add_mesh_cube("Inverter500W", size=0.12, location=(-0.09, 0.07, 0.02), material=mat_inverter)
-inverter.scale = (0.12/2, 0.06/2, 0.04/2); bpy.ops.object.transform_apply(scale=True)
+inverter = add_mesh_cube("Inverter500W", size=(0.12, 0.06, 0.04), location=(-0.09, 0.07, 0.02), material=mat_inverter)
 
 # Cables: battery -> inverter -> pcb -> coils (simple curves)
-cab1 = add_bezier_cable("Cable_batt_inv", [battery.location + Vector((0.03,0,0.01)), inverter.location + Vector((-0.03,0,0.01))], bevel_depth=0.003, material=mat_cable_red)
-cab2 = add_bezier_cable("Cable_inv_pcb", [inverter.location + Vector((0.03,0,0.01)), pcb.location + Vector((-0.03,0,0.01))], bevel_depth=0.003, material=mat_cable_black)
+red_cables = [([battery.location + Vector((0.03,0,0.01)), inverter.location + Vector((-0.03,0,0.01))], 0.003)]
+black_cables = [([inverter.location + Vector((0.03,0,0.01)), pcb.location + Vector((-0.03,0,0.01))], 0.003)]
 
 # Simple cable branches to coils (red/black pairs)
-for idx, coil in enumerate([obj for obj in bpy.data.objects if obj.name.startswith("Coil_")]):
-    ang = idx * (math.pi/2)
-    coil_pos = Vector((math.cos(ang) * coil_major, math.sin(ang) * coil_major, coil_z))
-    p_start = pcb.location + Vector((0,0,0.01))
-    cable_r = add_bezier_cable(f"Cable_r_{idx+1}", [p_start, coil_pos + Vector((0,0,0.02))], bevel_depth=0.0022, material=mat_cable_red)
-    cable_b = add_bezier_cable(f"Cable_b_{idx+1}", [battery.location + Vector((0.03,0,0.01)), coil_pos - Vector((0,0,0.02))], bevel_depth=0.0022, material=mat_cable_black)
+p_start = pcb.location + Vector((0,0,0.01))
+for x, y in zip(coil_xs, coil_ys):
+    coil_pos = Vector((x, y, coil_z))
+    red_cables.append(([p_start, coil_pos + Vector((0,0,0.02))], 0.0022))
+    black_cables.append(([battery.location + Vector((0.03,0,0.01)), coil_pos - Vector((0,0,0.02))], 0.0022))
+
+cables_red = add_bezier_cable("Cables_red", red_cables, material=mat_cable_red)
+cables_black = add_bezier_cable("Cables_black", black_cables, material=mat_cable_black)
 
 # Parent logical groups for cleanliness
 disk.parent = shaft
 for o in [o for o in bpy.data.objects if o.name.startswith("Magnet_")]:
     o.parent = disk
 
+# Bind all materials in one pass now that every mesh exists
+assign_pending_materials()
+
+# Everything that never moves goes into one mesh; shaft, disk and magnets stay separate
+static_prefixes = ("WoodenBase", "Coil_", "Wire_", "PCB", "BridgeRectifier", "HeatSinkBase", "Fin_", "Battery12V", "Inverter500W", "Cables_")
+static_body = join_meshes("StaticBody", [o for o in bpy.data.objects if o.name.startswith(static_prefixes)])
+
 # ---------- Camera & Lighting ----------
 # Camera
 cam_data = bpy.data.cameras.new("Camera")
-cam = bpy.data.objects.new("Camera", cam_data)
-bpy.context.collection.objects.link(cam)
+cam = new_object("Camera", cam_data)
 cam.location = (0.6, -0.6, 0.45)
 cam.rotation_euler = Euler((math.radians(60), 0, math.radians(45)), 'XYZ')
 bpy.context.scene.camera = cam
@@ -229,24 +407,21 @@ bpy.context.scene.camera = cam
 # Lighting: 3-point
 light_data = bpy.data.lights.new(name="KeyLight", type='AREA')
 light_data.energy = 1200
-light_obj = bpy.data.objects.new("KeyLight", light_data)
+light_obj = new_object("KeyLight", light_data)
 light_obj.location = (0.5, -0.5, 0.5)
 light_obj.data.size = 0.4
-bpy.context.collection.objects.link(light_obj)
 
 fill_data = bpy.data.lights.new(name="FillLight", type='AREA')
 fill_data.energy = 400
-fill = bpy.data.objects.new("FillLight", fill_data)
+fill = new_object("FillLight", fill_data)
 fill.location = (-0.4, -0.3, 0.4)
 fill.data.size = 0.3
-bpy.context.collection.objects.link(fill)
 
 rim_data = bpy.data.lights.new(name="RimLight", type='AREA')
 rim_data.energy = 300
-rim = bpy.data.objects.new("RimLight", rim_data)
+rim = new_object("RimLight", rim_data)
 rim.location = (-0.5, 0.5, 0.5)
 rim.data.size = 0.3
-bpy.context.collection.objects.link(rim)
 
 # World: soft gray + slight HDRI-ish feel via strength
 world = bpy.context.scene.world
@@ -256,18 +431,44 @@ bg.inputs['Color'].default_value = (0.03, 0.03, 0.03, 1)
 bg.inputs['Strength'].default_value = 0.6
 
 # ---------- Render settings ----------
-bpy.context.scene.render.engine = 'CYCLES'
-bpy.context.scene.cycles.samples = 128
-bpy.context.scene.cycles.device = 'CPU'  # change to 'GPU' if configured
+# RENDER_ENGINE=BLENDER_EEVEE_NEXT (BLENDER_EEVEE before 4.2) for fast previews; materials port unchanged
+render_engine = os.environ.get("RENDER_ENGINE", 'CYCLES')
+engine_items = bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items
+if render_engine not in {item.identifier for item in engine_items}:
+    # unknown or version-specific name: fall back instead of aborting before export
+    print(f"RENDER_ENGINE={render_engine!r} is not available in this Blender, using CYCLES")
+    render_engine = 'CYCLES'
+bpy.context.scene.render.engine = render_engine
+bpy.context.scene.cycles.samples = 32  # denoised, so far fewer samples are needed
+bpy.context.scene.cycles.use_adaptive_sampling = True
+bpy.context.scene.cycles.adaptive_threshold = 0.01
+# GPU if OptiX/CUDA devices are available, otherwise stay on CPU
+gpu_backend = enable_gpu_devices()
+bpy.context.scene.cycles.device = 'GPU' if gpu_backend else 'CPU'
+bpy.context.scene.cycles.use_denoising = True
+bpy.context.scene.cycles.denoiser = 'OPTIX' if gpu_backend == 'OPTIX' else 'OPENIMAGEDENOISE'
+bpy.context.scene.render.use_persistent_data = True  # keep BVH/textures between frames
 bpy.context.scene.render.film_transparent = False
 bpy.context.scene.view_settings.view_transform = 'Filmic'
 
 # ---------- Export ----------
 export_path = "/tmp/magnetic_generator.glb"  # change to desired path
-bpy.ops.object.select_all(action='DESELECT')
-for obj in bpy.data.objects:
-    obj.select_set(True)
-bpy.ops.export_scene.gltf(filepath=export_path, export_format='GLB', export_materials='EXPORT')
+# select everything in one call instead of a per-object select_set loop
+bpy.ops.object.select_all(action='SELECT')
+# static scene: skip modifier baking and the animation/skin/shape-key walkers;
+# lights/camera stay out as before (area lights have no glTF equivalent anyway)
+bpy.ops.export_scene.gltf(
+    filepath=export_path,
+    export_format='GLB',
+    export_materials='EXPORT',
+    use_selection=True,
+    export_apply=False,
+    export_animations=False,
+    export_skins=False,
+    export_morph=False,
+    export_lights=False,
+    export_cameras=False,
+)
 print("Exported to", export_path)
 
 # ---------- Finished ----------